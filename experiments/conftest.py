@@ -0,0 +1,11 @@
+"""Shared pytest configuration for the experiments test suite."""
+
+import os
+import sys
+import types
+
+# Make the experiment modules importable and stub out starlink_grpc — which
+# needs a dish and the starlink-grpc-tools checkout — once per session,
+# before any test imports starlink_ping_monitor
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.modules.setdefault('starlink_grpc', types.ModuleType('starlink_grpc'))
@@ -12,7 +12,7 @@ Setup:
 1. Clone starlink-grpc-tools: 
    git clone https://github.com/sparky8512/starlink-grpc-tools.git
 2. Install requirements:
-   pip install grpcio protobuf
+   pip install grpcio protobuf numpy
 3. Ensure you can reach your dish at 192.168.100.1
 
 Usage:
@@ -21,11 +21,21 @@ Usage:
 Where experiment_number is 1, 2, or 3
 """
 
+import atexit
+import math
+import queue
 import sys
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import grpc
+import numpy as np
+
+from starlink_ping_common import ttl_cached
+
 # You'll need to have the starlink-grpc-tools in your path
 # or run this from the starlink-grpc-tools directory
 try:
@@ -37,6 +47,203 @@ except ImportError:
     sys.exit(1)
 
 
+# orjson (a C-speed JSON encoder) is used when available; the scripts fall
+# back to the stdlib encoder so it stays an optional dependency
+try:
+    import orjson
+
+    def _json_line(obj):
+        """Serialize one sample to a JSON line"""
+        return orjson.dumps(obj).decode() + '\n'
+
+    def _dump_json(obj, filename):
+        """Write obj to filename as an indented JSON document"""
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+except ImportError:
+    def _json_line(obj):
+        """Serialize one sample to a JSON line"""
+        return json.dumps(obj) + '\n'
+
+    def _dump_json(obj, filename):
+        """Write obj to filename as an indented JSON document"""
+        with open(filename, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+# Shared gRPC channel to the dish, created on first use. Reusing one channel
+# avoids a fresh TCP + HTTP/2 handshake on every sample.
+_channel_context = None
+
+
+def get_channel_context():
+    """Return the shared starlink_grpc channel context, creating it on first use"""
+    global _channel_context
+    if _channel_context is None:
+        _channel_context = starlink_grpc.ChannelContext()
+        atexit.register(_channel_context.close)
+    return _channel_context
+
+
+# Worker pool used to overlap the status and history RPCs of one sample
+_rpc_pool = ThreadPoolExecutor(max_workers=2)
+
+# Cache for iso_now(): the formatted timestamp only changes once per second,
+# so repeated stamps within a second reuse one string instead of building a
+# fresh datetime + isoformat each time
+_last_iso = [0, '']
+
+
+def iso_now():
+    """Return the current local time in ISO format, cached per whole second"""
+    now = int(time.time())
+    if now != _last_iso[0]:
+        _last_iso[0] = now
+        _last_iso[1] = datetime.fromtimestamp(now).isoformat()
+    return _last_iso[1]
+
+
+# Pre-rendered bar strings for the SNR chart, so rendering a wedge is a table
+# lookup instead of a fresh string multiplication
+_BARS = tuple('█' * n for n in range(128))
+
+
+# Sample fields that change monotonically every tick; excluded when checking
+# whether two adjacent samples are duplicates, since readers can re-derive
+# them from the run position and the run's "until" timestamp
+_RUN_EXEMPT_KEYS = ('timestamp', 'sample_number')
+
+
+class SampleWriter:
+    """
+    Background JSON-lines writer.
+
+    Samples are queued and written by a daemon thread so the sampling loop is
+    never stalled by disk latency (SD-card wear-leveling pauses can exceed
+    100 ms). The queue is bounded; if it ever fills, the oldest queued sample
+    is dropped in favour of the newest.
+
+    Adjacent samples that are identical apart from _RUN_EXEMPT_KEYS are
+    run-length encoded: instead of repeating the full record, a compact
+    {"repeat": N, "until": ts} line notes N further identical samples, the
+    last of them taken at ts. This keeps output files small while the dish
+    sits idle. Readers expand a run from the preceding full record.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, filename, maxsize=1024):
+        self.filename = filename
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._prev_body = None
+        self._repeats = 0
+        self._last_timestamp = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        with open(self.filename, 'w') as outfile:
+            while True:
+                sample = self._queue.get()
+                if sample is self._SENTINEL:
+                    break
+                outfile.write(_json_line(sample))
+                outfile.flush()
+
+    def _enqueue(self, record):
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(record)
+
+    def _flush_run(self):
+        if self._repeats:
+            self._enqueue({'repeat': self._repeats,
+                           'until': self._last_timestamp})
+            self._repeats = 0
+
+    def put(self, sample):
+        """Queue one sample without blocking the sampling loop"""
+        body = {k: v for k, v in sample.items() if k not in _RUN_EXEMPT_KEYS}
+        if body == self._prev_body:
+            self._repeats += 1
+            self._last_timestamp = sample.get('timestamp')
+            return
+        self._flush_run()
+        self._prev_body = body
+        self._enqueue(sample)
+
+    def close(self):
+        """Flush queued samples and stop the writer thread"""
+        self._flush_run()
+        self._queue.put(self._SENTINEL)
+        self._thread.join()
+
+
+class RunningStats:
+    """
+    Single-pass mean/min/max/stdev accumulator (Welford's algorithm).
+
+    Lets the experiments stream samples to disk as they arrive and still
+    produce summary statistics without holding every sample in memory.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self._m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def stdev(self):
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self._m2 / (self.count - 1))
+
+
+@ttl_cached(0.25)
+def fetch_status_and_history():
+    """
+    Fetch status data and history ping stats in one round-trip's time.
+
+    The short TTL collapses duplicate fetches from rapid consumers within
+    one tick; at the experiments' 10 s cadence every sample is fresh.
+
+    The dish's Request message is a oneof, so the two reads cannot be bundled
+    into a single RPC; instead both are issued concurrently over the shared
+    channel so a sample costs one RTT instead of two.
+
+    Returns:
+        Tuple of (status_data, errors, history_stats). history_stats is None
+        when history is not available.
+    """
+    context = get_channel_context()
+    status_future = _rpc_pool.submit(starlink_grpc.get_status, context=context)
+    history_future = _rpc_pool.submit(starlink_grpc.history_ping_stats,
+                                      context=context)
+    status_data, errors = status_future.result()
+    try:
+        history_stats = history_future.result()
+    except Exception:
+        # History stats might not be available, continue without them
+        history_stats = None
+    return status_data, errors, history_stats
+
+
 def experiment_1_basic_status_monitor():
     """
     Experiment 1: Basic Status Monitor
@@ -60,78 +267,92 @@ def experiment_1_basic_status_monitor():
     print("\nCollecting status data every 5 seconds for 1 minute...")
     print("Press Ctrl+C to stop early\n")
     
-    results = []
-    
+    # Stream each sample to disk as a JSON line so nothing is lost on Ctrl+C
+    # and memory stays bounded regardless of run length
+    filename = f"starlink_status_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    count = 0
+    download = RunningStats()
+    upload = RunningStats()
+    latency = RunningStats()
+    obstruction = RunningStats()
+
+    writer = SampleWriter(filename)
     try:
-        for i in range(12):  # 12 samples over 1 minute
-            timestamp = datetime.now().isoformat()
-            
-            # Get status data from dish
-            try:
-                status_data, errors = starlink_grpc.get_status()
-                
-                # Extract key metrics
-                data_point = {
-                    'timestamp': timestamp,
-                    'state': status_data.get('state', 'UNKNOWN'),
-                    'uptime_seconds': status_data.get('uptime', 0),
-                    'snr': status_data.get('snr'),
-                    'fraction_obstructed': status_data.get('fraction_obstructed', 0),
-                    'downlink_throughput_bps': status_data.get('downlink_throughput_bps', 0),
-                    'uplink_throughput_bps': status_data.get('uplink_throughput_bps', 0),
-                    'pop_ping_latency_ms': status_data.get('pop_ping_latency_ms', 0),
-                    'alerts': status_data.get('alerts', 0)
-                }
-                
-                results.append(data_point)
-                
-                # Display current reading
-                print(f"\n[Sample {i+1}/12] @ {timestamp}")
-                print(f"  State: {data_point['state']}")
-                print(f"  Uptime: {data_point['uptime_seconds']} seconds "
-                      f"({data_point['uptime_seconds']/3600:.1f} hours)")
-                print(f"  Obstruction: {data_point['fraction_obstructed']*100:.1f}%")
-                print(f"  Download: {data_point['downlink_throughput_bps']/1e6:.2f} Mbps")
-                print(f"  Upload: {data_point['uplink_throughput_bps']/1e6:.2f} Mbps")
-                print(f"  Latency: {data_point['pop_ping_latency_ms']:.1f} ms")
-                
-                if errors:
-                    print(f"  Errors: {errors}")
-                    
-            except Exception as e:
-                print(f"  Error collecting data: {e}")
-            
-            # Wait 5 seconds before next sample (skip on last iteration)
-            if i < 11:
-                time.sleep(5)
-    
-    except KeyboardInterrupt:
-        print("\n\nStopped by user")
-    
+        try:
+            deadline = time.monotonic()
+            for i in range(12):  # 12 samples over 1 minute
+                timestamp = iso_now()
+
+                # Get status data from dish
+                try:
+                    status_data, errors = starlink_grpc.get_status(context=get_channel_context())
+
+                    # Extract key metrics
+                    data_point = {
+                        'timestamp': timestamp,
+                        'state': status_data.get('state', 'UNKNOWN'),
+                        'uptime_seconds': status_data.get('uptime', 0),
+                        'snr': status_data.get('snr'),
+                        'fraction_obstructed': status_data.get('fraction_obstructed', 0),
+                        'downlink_throughput_bps': status_data.get('downlink_throughput_bps', 0),
+                        'uplink_throughput_bps': status_data.get('uplink_throughput_bps', 0),
+                        'pop_ping_latency_ms': status_data.get('pop_ping_latency_ms', 0),
+                        'alerts': status_data.get('alerts', 0)
+                    }
+
+                    writer.put(data_point)
+
+                    count += 1
+                    download.add(data_point['downlink_throughput_bps'])
+                    upload.add(data_point['uplink_throughput_bps'])
+                    latency.add(data_point['pop_ping_latency_ms'])
+                    obstruction.add(data_point['fraction_obstructed'])
+
+                    # Display current reading (one write per sample rather
+                    # than one per line)
+                    lines = [
+                        f"\n[Sample {i+1}/12] @ {timestamp}",
+                        f"  State: {data_point['state']}",
+                        f"  Uptime: {data_point['uptime_seconds']} seconds "
+                        f"({data_point['uptime_seconds']/3600:.1f} hours)",
+                        f"  Obstruction: {data_point['fraction_obstructed']*100:.1f}%",
+                        f"  Download: {data_point['downlink_throughput_bps']/1e6:.2f} Mbps",
+                        f"  Upload: {data_point['uplink_throughput_bps']/1e6:.2f} Mbps",
+                        f"  Latency: {data_point['pop_ping_latency_ms']:.1f} ms",
+                    ]
+                    if errors:
+                        lines.append(f"  Errors: {errors}")
+                    sys.stdout.write('\n'.join(lines) + '\n')
+                    sys.stdout.flush()
+
+                except Exception as e:
+                    print(f"  Error collecting data: {e}")
+
+                # Sleep towards a monotonic deadline so the 5 s cadence does
+                # not drift by the RPC time (skip on last iteration)
+                if i < 11:
+                    deadline += 5
+                    time.sleep(max(0, deadline - time.monotonic()))
+
+        except KeyboardInterrupt:
+            print("\n\nStopped by user")
+    finally:
+        writer.close()
+
     # Summary statistics
     print("\n" + "="*70)
     print("SUMMARY")
     print("="*70)
-    
-    if results:
-        avg_download = sum(r['downlink_throughput_bps'] for r in results) / len(results)
-        avg_upload = sum(r['uplink_throughput_bps'] for r in results) / len(results)
-        avg_latency = sum(r['pop_ping_latency_ms'] for r in results) / len(results)
-        avg_obstruction = sum(r['fraction_obstructed'] for r in results) / len(results)
-        
-        print(f"Samples collected: {len(results)}")
-        print(f"Average download: {avg_download/1e6:.2f} Mbps")
-        print(f"Average upload: {avg_upload/1e6:.2f} Mbps")
-        print(f"Average latency: {avg_latency:.1f} ms")
-        print(f"Average obstruction: {avg_obstruction*100:.1f}%")
-        
-        # Save to file
-        filename = f"starlink_status_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+
+    if count:
+        print(f"Samples collected: {count}")
+        print(f"Average download: {download.mean/1e6:.2f} Mbps")
+        print(f"Average upload: {upload.mean/1e6:.2f} Mbps")
+        print(f"Average latency: {latency.mean:.1f} ms")
+        print(f"Average obstruction: {obstruction.mean*100:.1f}%")
         print(f"\nData saved to: {filename}")
-    
-    return results
+
+    return filename
 
 
 def experiment_2_obstruction_analysis():
@@ -158,8 +379,8 @@ def experiment_2_obstruction_analysis():
     
     try:
         # Get obstruction detail
-        status_data, errors = starlink_grpc.get_status()
-        obstruction_data, errors2 = starlink_grpc.get_obstruction_map()
+        status_data, errors = starlink_grpc.get_status(context=get_channel_context())
+        obstruction_data, errors2 = starlink_grpc.get_obstruction_map(context=get_channel_context())
         
         print("OBSTRUCTION OVERVIEW")
         print("-" * 70)
@@ -202,15 +423,15 @@ def experiment_2_obstruction_analysis():
         if obstruction_data and 'snr' in obstruction_data:
             snr_map = obstruction_data['snr']
             
-            # Analyze SNR values (lower SNR = more obstruction)
+            # Analyze SNR values (lower SNR = more obstruction). Bar lengths
+            # are computed vectorized and the chart emitted as one write.
             print("Signal Quality by Direction (higher is better):")
-            for i, direction in enumerate(directions):
-                if i < len(snr_map):
-                    snr_value = snr_map[i]
-                    # Create a simple bar chart
-                    bar_length = int(snr_value / 2) if snr_value > 0 else 0
-                    bar = "█" * bar_length
-                    print(f"{direction:15} {snr_value:6.1f} dB {bar}")
+            snr_values = np.asarray(snr_map[:len(directions)], dtype=np.float64)
+            bar_lengths = np.clip((snr_values / 2).astype(int), 0, len(_BARS) - 1)
+            print('\n'.join(
+                f"{direction:15} {snr_value:6.1f} dB {_BARS[bar_length]}"
+                for direction, snr_value, bar_length
+                in zip(directions, snr_values, bar_lengths)))
         
         # Additional analysis
         print("\nDISH POINTING INFORMATION")
@@ -237,7 +458,7 @@ def experiment_2_obstruction_analysis():
         
         # Save data
         result = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': iso_now(),
             'fraction_obstructed': fraction_obstructed,
             'obstruction_duration': obstruction_duration,
             'obstruction_interval': obstruction_interval,
@@ -247,8 +468,7 @@ def experiment_2_obstruction_analysis():
         }
         
         filename = f"starlink_obstruction_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(result, f, indent=2)
+        _dump_json(result, filename)
         print(f"\nData saved to: {filename}")
         
         return result
@@ -283,140 +503,156 @@ def experiment_3_performance_variability():
     print("\nMeasuring performance every 10 seconds for 2 minutes...")
     print("This will show you how stable your connection is\n")
     
-    results = []
-    
+    # Stream each sample to disk as a JSON line so nothing is lost on Ctrl+C
+    # and memory stays bounded regardless of run length
+    filename = f"starlink_variability_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    downloads = []
+    uploads = []
+    latencies = []
+    states = set()
+
+    writer = SampleWriter(filename)
     try:
-        for i in range(12):  # 12 samples over 2 minutes
-            timestamp = datetime.now().isoformat()
-            
-            try:
-                # Get both status and history data
-                status_data, errors = starlink_grpc.get_status()
-                
-                # Try to get ping stats from history
+        try:
+            deadline = time.monotonic()
+            for i in range(12):  # 12 samples over 2 minutes
+                timestamp = iso_now()
+
                 try:
-                    history_stats = starlink_grpc.history_ping_stats()
-                    ping_drop_rate = history_stats.get('ping_drop_rate', 0)
-                    ping_latency_mean = history_stats.get('ping_latency_ms_mean', 0)
-                except:
-                    ping_drop_rate = 0
-                    ping_latency_mean = status_data.get('pop_ping_latency_ms', 0)
-                
-                data_point = {
-                    'timestamp': timestamp,
-                    'sample_number': i + 1,
-                    'state': status_data.get('state', 'UNKNOWN'),
-                    'downlink_mbps': status_data.get('downlink_throughput_bps', 0) / 1e6,
-                    'uplink_mbps': status_data.get('uplink_throughput_bps', 0) / 1e6,
-                    'latency_ms': status_data.get('pop_ping_latency_ms', 0),
-                    'ping_drop_rate': ping_drop_rate,
-                    'fraction_obstructed': status_data.get('fraction_obstructed', 0)
-                }
-                
-                results.append(data_point)
-                
-                # Display current reading
-                print(f"[{i+1:2d}/12] {data_point['state']:12} | "
-                      f"↓{data_point['downlink_mbps']:6.2f} Mbps | "
-                      f"↑{data_point['uplink_mbps']:5.2f} Mbps | "
-                      f"{data_point['latency_ms']:5.1f} ms | "
-                      f"Drop: {data_point['ping_drop_rate']*100:4.1f}%")
-                
-            except Exception as e:
-                print(f"  Error collecting sample {i+1}: {e}")
-            
-            # Wait 10 seconds before next sample
-            if i < 11:
-                time.sleep(10)
-    
-    except KeyboardInterrupt:
-        print("\n\nStopped by user")
-    
+                    # Get both status and history data in one round-trip's time
+                    status_data, errors, history_stats = fetch_status_and_history()
+
+                    if history_stats:
+                        ping_drop_rate = history_stats.get('ping_drop_rate', 0)
+                        ping_latency_mean = history_stats.get('ping_latency_ms_mean', 0)
+                    else:
+                        ping_drop_rate = 0
+                        ping_latency_mean = status_data.get('pop_ping_latency_ms', 0)
+
+                    data_point = {
+                        'timestamp': timestamp,
+                        'sample_number': i + 1,
+                        'state': status_data.get('state', 'UNKNOWN'),
+                        'downlink_mbps': status_data.get('downlink_throughput_bps', 0) / 1e6,
+                        'uplink_mbps': status_data.get('uplink_throughput_bps', 0) / 1e6,
+                        'latency_ms': status_data.get('pop_ping_latency_ms', 0),
+                        'ping_drop_rate': ping_drop_rate,
+                        'fraction_obstructed': status_data.get('fraction_obstructed', 0)
+                    }
+
+                    writer.put(data_point)
+
+                    downloads.append(data_point['downlink_mbps'])
+                    uploads.append(data_point['uplink_mbps'])
+                    latencies.append(data_point['latency_ms'])
+                    states.add(data_point['state'])
+
+                    # Display current reading
+                    print(f"[{i+1:2d}/12] {data_point['state']:12} | "
+                          f"↓{data_point['downlink_mbps']:6.2f} Mbps | "
+                          f"↑{data_point['uplink_mbps']:5.2f} Mbps | "
+                          f"{data_point['latency_ms']:5.1f} ms | "
+                          f"Drop: {data_point['ping_drop_rate']*100:4.1f}%")
+
+                except Exception as e:
+                    print(f"  Error collecting sample {i+1}: {e}")
+
+                # Sleep towards a monotonic deadline so the 10 s cadence does
+                # not drift by the RPC time (skip on last iteration)
+                if i < 11:
+                    deadline += 10
+                    time.sleep(max(0, deadline - time.monotonic()))
+
+        except KeyboardInterrupt:
+            print("\n\nStopped by user")
+    finally:
+        writer.close()
+
     # Analysis
     print("\n" + "="*70)
     print("VARIABILITY ANALYSIS")
     print("="*70)
-    
-    if len(results) >= 2:
-        # Calculate statistics
-        downloads = [r['downlink_mbps'] for r in results]
-        uploads = [r['uplink_mbps'] for r in results]
-        latencies = [r['latency_ms'] for r in results]
-        
-        import statistics
-        
+
+    if len(downloads) >= 2:
+        # Vectorized reductions: one C-level pass per metric instead of
+        # several Python-level loops
+        dl = np.asarray(downloads, dtype=np.float64)
+        ul = np.asarray(uploads, dtype=np.float64)
+        lat = np.asarray(latencies, dtype=np.float64)
+        dl_stdev = dl.std(ddof=1)
+        ul_stdev = ul.std(ddof=1)
+        lat_stdev = lat.std(ddof=1)
+
         print("\nDownload Speed:")
-        print(f"  Mean: {statistics.mean(downloads):.2f} Mbps")
-        print(f"  Min: {min(downloads):.2f} Mbps")
-        print(f"  Max: {max(downloads):.2f} Mbps")
-        if len(downloads) > 1:
-            print(f"  Std Dev: {statistics.stdev(downloads):.2f} Mbps")
-            print(f"  Coefficient of Variation: {statistics.stdev(downloads)/statistics.mean(downloads)*100:.1f}%")
-        
+        print(f"  Mean: {dl.mean():.2f} Mbps")
+        print(f"  Min: {dl.min():.2f} Mbps")
+        print(f"  Max: {dl.max():.2f} Mbps")
+        print(f"  Std Dev: {dl_stdev:.2f} Mbps")
+        print(f"  Coefficient of Variation: {dl_stdev/dl.mean()*100:.1f}%")
+
         print("\nUpload Speed:")
-        print(f"  Mean: {statistics.mean(uploads):.2f} Mbps")
-        print(f"  Min: {min(uploads):.2f} Mbps")
-        print(f"  Max: {max(uploads):.2f} Mbps")
-        if len(uploads) > 1:
-            print(f"  Std Dev: {statistics.stdev(uploads):.2f} Mbps")
-            print(f"  Coefficient of Variation: {statistics.stdev(uploads)/statistics.mean(uploads)*100:.1f}%")
-        
+        print(f"  Mean: {ul.mean():.2f} Mbps")
+        print(f"  Min: {ul.min():.2f} Mbps")
+        print(f"  Max: {ul.max():.2f} Mbps")
+        print(f"  Std Dev: {ul_stdev:.2f} Mbps")
+        print(f"  Coefficient of Variation: {ul_stdev/ul.mean()*100:.1f}%")
+
         print("\nLatency:")
-        print(f"  Mean: {statistics.mean(latencies):.1f} ms")
-        print(f"  Min: {min(latencies):.1f} ms")
-        print(f"  Max: {max(latencies):.1f} ms")
-        if len(latencies) > 1:
-            print(f"  Std Dev: {statistics.stdev(latencies):.1f} ms")
-            print(f"  Jitter (approx): {statistics.stdev(latencies):.1f} ms")
-        
+        print(f"  Mean: {lat.mean():.1f} ms")
+        print(f"  Min: {lat.min():.1f} ms")
+        print(f"  Max: {lat.max():.1f} ms")
+        print(f"  Std Dev: {lat_stdev:.1f} ms")
+        print(f"  Jitter (approx): {lat_stdev:.1f} ms")
+
         print("\nSTABILITY ASSESSMENT")
         print("-" * 70)
-        
+
         # Check for connection state changes
-        states = [r['state'] for r in results]
-        if len(set(states)) > 1:
+        if len(states) > 1:
             print("⚠ Connection state changed during monitoring")
-            print(f"  States observed: {set(states)}")
+            print(f"  States observed: {states}")
         else:
-            print(f"✓ Connection remained stable: {states[0]}")
-        
+            print(f"✓ Connection remained stable: {next(iter(states))}")
+
         # Check variability
-        if len(downloads) > 1:
-            cv_download = statistics.stdev(downloads)/statistics.mean(downloads)*100
-            if cv_download > 30:
-                print("⚠ High download speed variability (CV > 30%)")
-                print("  Your connection may not be suitable for consistent streaming")
-            elif cv_download > 15:
-                print("⚠ Moderate download speed variability (CV 15-30%)")
-                print("  Occasional buffering may occur during video streaming")
-            else:
-                print("✓ Low download speed variability (CV < 15%)")
-                print("  Good for streaming and downloads")
-        
-        if len(latencies) > 1:
-            jitter = statistics.stdev(latencies)
-            if jitter > 20:
-                print("⚠ High latency jitter (>20ms)")
-                print("  May affect real-time applications (gaming, video calls)")
-            elif jitter > 10:
-                print("⚠ Moderate latency jitter (10-20ms)")
-                print("  Acceptable for most applications")
-            else:
-                print("✓ Low latency jitter (<10ms)")
-                print("  Excellent for real-time applications")
-        
-        # Save data
-        filename = f"starlink_variability_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        cv_download = dl_stdev/dl.mean()*100
+        if cv_download > 30:
+            print("⚠ High download speed variability (CV > 30%)")
+            print("  Your connection may not be suitable for consistent streaming")
+        elif cv_download > 15:
+            print("⚠ Moderate download speed variability (CV 15-30%)")
+            print("  Occasional buffering may occur during video streaming")
+        else:
+            print("✓ Low download speed variability (CV < 15%)")
+            print("  Good for streaming and downloads")
+
+        jitter = lat_stdev
+        if jitter > 20:
+            print("⚠ High latency jitter (>20ms)")
+            print("  May affect real-time applications (gaming, video calls)")
+        elif jitter > 10:
+            print("⚠ Moderate latency jitter (10-20ms)")
+            print("  Acceptable for most applications")
+        else:
+            print("✓ Low latency jitter (<10ms)")
+            print("  Excellent for real-time applications")
+
         print(f"\nData saved to: {filename}")
-    
-    return results
+
+    return filename
+
+
+# Experiment dispatch table: CLI argument -> entry point
+_EXPERIMENTS = {
+    '1': experiment_1_basic_status_monitor,
+    '2': experiment_2_obstruction_analysis,
+    '3': experiment_3_performance_variability,
+}
 
 
 def main():
     """Main function to run experiments"""
-    
+
     if len(sys.argv) < 2:
         print(__doc__)
         print("\nAvailable experiments:")
@@ -425,41 +661,33 @@ def main():
         print("  3 - Performance Variability (2 minutes)")
         print("\nExample: python3 starlink_basic_experiments.py 1")
         sys.exit(1)
-    
-    experiment_num = sys.argv[1]
-    
-    # Check if dish is reachable
+
+    experiment = _EXPERIMENTS.get(sys.argv[1])
+    if experiment is None:
+        print(f"ERROR: Unknown experiment number: {sys.argv[1]}")
+        print("Please choose 1, 2, or 3")
+        sys.exit(1)
+
+    # Check if dish is reachable. This waits on the shared gRPC channel
+    # becoming ready, so the same warmed-up connection serves the first RPC.
     print("Checking Starlink dish connectivity at 192.168.100.1...")
     try:
-        import socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex(('192.168.100.1', 9200))
-        sock.close()
-        
-        if result != 0:
-            print("ERROR: Cannot reach Starlink dish at 192.168.100.1:9200")
-            print("Please ensure:")
-            print("  1. Your Starlink dish is powered on")
-            print("  2. You are connected to the Starlink network")
-            print("  3. You can access http://192.168.100.1 in a browser")
-            sys.exit(1)
+        channel = get_channel_context().get_channel()
+        grpc.channel_ready_future(channel).result(timeout=2)
         print("✓ Dish is reachable\n")
+    except grpc.FutureTimeoutError:
+        print("ERROR: Cannot reach Starlink dish at 192.168.100.1:9200")
+        print("Please ensure:")
+        print("  1. Your Starlink dish is powered on")
+        print("  2. You are connected to the Starlink network")
+        print("  3. You can access http://192.168.100.1 in a browser")
+        sys.exit(1)
     except Exception as e:
         print(f"ERROR: Could not check dish connectivity: {e}")
         sys.exit(1)
-    
+
     # Run selected experiment
-    if experiment_num == '1':
-        experiment_1_basic_status_monitor()
-    elif experiment_num == '2':
-        experiment_2_obstruction_analysis()
-    elif experiment_num == '3':
-        experiment_3_performance_variability()
-    else:
-        print(f"ERROR: Unknown experiment number: {experiment_num}")
-        print("Please choose 1, 2, or 3")
-        sys.exit(1)
+    experiment()
 
 
 if __name__ == '__main__':
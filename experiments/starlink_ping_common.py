@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Shared terminal display helpers for the Starlink ping monitor scripts.
+
+Holds the frame rendering used by both starlink_ping_monitor.py and
+starlink_ping_monitor_demo.py so the two copies cannot drift apart. The
+display caches the sorted key list and column width across frames, since the
+key set is static after startup, and redraws frames in place with ANSI cursor
+addressing instead of clearing the screen every tick.
+"""
+
+import functools
+import os
+import sys
+import time
+
+# ANSI control sequences used to redraw frames in place. Homing the cursor
+# and overwriting avoids forking /bin/clear (or cls) once per second and the
+# flicker of a full clear+reprint.
+_ANSI_HOME = '\x1b[H'
+_ANSI_CLEAR_SCREEN = '\x1b[2J'
+_ANSI_CLEAR_EOL = '\x1b[K'
+_ANSI_CLEAR_EOS = '\x1b[J'
+_ANSI_HIDE_CURSOR = '\x1b[?25l'
+_ANSI_SHOW_CURSOR = '\x1b[?25h'
+
+
+def ttl_cached(seconds):
+    """
+    Cache a function's most recent result for a short time window.
+
+    Rapid consumers inside one process (e.g. the monitor loop plus another
+    caller polling within the same tick) reuse the last response instead of
+    issuing another RPC at the dish. The cache is keyed per function, not per
+    argument, so it is meant for fixed-argument fetch wrappers.
+    """
+    def decorator(fn):
+        last = [0.0, None]
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            if last[1] is not None and now - last[0] < seconds:
+                return last[1]
+            value = fn(*args, **kwargs)
+            last[0] = now
+            last[1] = value
+            return value
+        return wrapper
+    return decorator
+
+
+class PingDisplay:
+    """
+    Renders ping-statistics frames in place.
+
+    The sorted key list and key column width are recomputed only when the key
+    set changes, so steady-state frames skip the per-tick sorted() + max().
+    """
+
+    def __init__(self, title="STARLINK PING STATISTICS MONITOR",
+                 footer_lines=()):
+        self.title = title
+        self.footer_lines = tuple(footer_lines)
+        self._initialized = False
+        self._cached_keyset = None
+        self._cached_keys = ()
+        self._cached_width = 0
+
+    def _layout(self, ping_stats):
+        """Return (sorted_keys, key_width), reusing the cache when unchanged"""
+        keyset = frozenset(ping_stats.keys())
+        if keyset != self._cached_keyset:
+            self._cached_keyset = keyset
+            self._cached_keys = tuple(sorted(keyset))
+            self._cached_width = max(map(len, keyset)) if keyset else 0
+        return self._cached_keys, self._cached_width
+
+    def _emit(self, text):
+        """
+        Write text to the terminal in one write() syscall.
+
+        The text is pre-encoded and written straight to stdout's file
+        descriptor, skipping the text-layer buffering and per-line encoding;
+        stdout is flushed first so ordering with print() output is kept.
+        When stdout has no file descriptor (captured or redirected to a
+        non-file object), fall back to the regular text write.
+        """
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        if fd is None:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        else:
+            sys.stdout.flush()
+            os.write(fd, text.encode('utf-8'))
+
+    def write_frame(self, lines):
+        """
+        Emit one display frame as a single write.
+
+        Each line is followed by a clear-to-end-of-line so shorter lines
+        fully overwrite the previous frame, and the frame ends with a
+        clear-to-end-of-screen so anything left over from a taller previous
+        frame does not persist below this one.
+        """
+        prefix = _ANSI_HOME
+        if not self._initialized:
+            # First frame: clear the screen once and hide the cursor
+            prefix = _ANSI_CLEAR_SCREEN + _ANSI_HIDE_CURSOR + prefix
+            self._initialized = True
+        self._emit(
+            prefix + ''.join(line + _ANSI_CLEAR_EOL + '\n' for line in lines)
+            + _ANSI_CLEAR_EOS)
+
+    def show(self, ping_stats, timestamp, iteration, format_value=str,
+             extra_lines=()):
+        """
+        Display ping statistics in a clean, readable format.
+
+        Args:
+            ping_stats: Dictionary of ping statistics
+            timestamp: Timestamp of the data collection
+            iteration: Current iteration number
+            format_value: Callable used to format each value for display
+            extra_lines: Optional lines (e.g. error reports) appended after
+                the closing bar, inside the frame so they are overwritten
+                on the next tick
+        """
+        lines = [
+            "=" * 80,
+            self.title,
+            "=" * 80,
+            f"Timestamp: {timestamp}",
+            f"Iteration: {iteration}",
+            "Press Ctrl+C to stop",
+            "=" * 80,
+            "",
+        ]
+
+        if not ping_stats:
+            lines.append("No ping statistics available")
+        else:
+            keys, key_width = self._layout(ping_stats)
+            for key in keys:
+                formatted_value = format_value(ping_stats[key])
+                lines.append(f"  {key:<{key_width}} : {formatted_value}")
+
+        lines.append("")
+        lines.append("=" * 80)
+        lines.extend(extra_lines)
+        lines.extend(self.footer_lines)
+
+        self.write_frame(lines)
+
+    def restore(self):
+        """Clear the last frame and re-enable the cursor before exiting"""
+        self._emit(_ANSI_HOME + _ANSI_CLEAR_SCREEN + _ANSI_SHOW_CURSOR)
+        self._initialized = False
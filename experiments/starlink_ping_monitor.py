@@ -8,19 +8,30 @@ set of statistics.
 
 Requirements:
 - Starlink dish accessible at 192.168.100.1
-- Python 3.7+ with grpcio and protobuf installed
+- Python 3.10+ with grpcio and protobuf installed
 - starlink-grpc-tools repository in Python path
 
 Usage:
     python3 starlink_ping_monitor.py
 
+For long-running production monitoring, run with -O so any in-loop assert
+statements are stripped from the bytecode:
+    python3 -O starlink_ping_monitor.py
+
 Press Ctrl+C to stop.
 """
 
+import asyncio
+import atexit
+import re
 import sys
 import time
-import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+
+from starlink_ping_common import PingDisplay, ttl_cached
 
 # Import starlink_grpc module
 try:
@@ -32,218 +43,442 @@ except ImportError:
     sys.exit(1)
 
 
-def clear_terminal():
-    """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+# Shared gRPC channel to the dish, created on first use. Reusing one channel
+# avoids a fresh TCP + HTTP/2 handshake on every 1 Hz poll.
+_channel_context = None
+
+
+def get_channel_context():
+    """Return the shared starlink_grpc channel context, creating it on first use"""
+    global _channel_context
+    if _channel_context is None:
+        _channel_context = starlink_grpc.ChannelContext()
+        atexit.register(_channel_context.close)
+    return _channel_context
+
+
+# Shared frame renderer; caches the display layout between ticks
+_display = PingDisplay()
+
+
+# Field classification patterns, compiled once at import
+_PING_RE = re.compile(r'(?i)ping')
 
+# One scan of the name instead of separate substring and prefix probes:
+# 'snr' anywhere, or a 'seconds_to_' prefix other than the
+# 'seconds_to_first_non_empty_slot' exception (encoded by the lookahead)
+_OBSOLETE_RE = re.compile(r'snr|^seconds_to_(?!first_non_empty_slot$)')
 
+
+def _is_obsolete_field_fast(field_name):
+    """
+    is_obsolete_field for names already in lowercase snake_case.
+
+    The starlink_grpc vocabulary is guaranteed lowercase, so the extraction
+    path calls this directly and skips the per-name .lower() allocation.
+    """
+    return _OBSOLETE_RE.search(field_name) is not None
+
+
+@lru_cache(maxsize=256)
 def is_obsolete_field(field_name):
     """
     Determine if a field is obsolete based on the problem requirements.
-    
+
+    Case-insensitive wrapper around the lowercase fast path. The result is
+    memoized: the field-name vocabulary is small and fixed, so after the
+    first poll each lookup is a cache hit instead of string work.
+
     Obsolete fields include:
     - Fields with 'snr' (case insensitive)
     - Fields starting with 'seconds_to_' EXCEPT 'seconds_to_first_non_empty_slot'
-    
+
     Args:
         field_name: Name of the field to check
-        
+
     Returns:
         True if the field is obsolete and should be ignored, False otherwise
     """
-    field_lower = field_name.lower()
-    
-    # Always include seconds_to_first_non_empty_slot even if marked obsolete
-    if field_name == 'seconds_to_first_non_empty_slot':
-        return False
-    
-    # Filter out SNR-related fields
-    if 'snr' in field_lower:
-        return True
-    
-    # Filter out other seconds_to_* fields
-    if field_name.startswith('seconds_to_'):
-        return True
-    
-    return False
+    return _is_obsolete_field_fast(field_name.lower())
+
+
+# Ping-related fields known from the stable starlink_grpc vocabulary,
+# enumerated once at import so the common case resolves by set intersection
+# without any per-name string scanning
+_PING_FIELD_WHITELIST = frozenset({
+    # status fields
+    'ping_drop_rate',
+    'ping_latency_ms',
+    'pop_ping_drop_rate',
+    'pop_ping_latency_ms',
+    'seconds_to_first_non_empty_slot',
+    # history ping statistics
+    'ping_latency_ms_mean',
+    'ping_latency_ms_p50',
+    'ping_latency_ms_p95',
+    'ping_latency_ms_p99',
+    'ping_packets_sent',
+    'ping_packets_received',
+    'total_ping_drop',
+    'count_full_ping_drop',
+    'total_obstructed_ping_drop',
+    'count_full_obstructed_ping_drop',
+    'total_unscheduled_ping_drop',
+    'count_full_unscheduled_ping_drop',
+    'mean_all_ping_latency',
+    'deciles_all_ping_latency',
+    'mean_full_ping_latency',
+    'deciles_full_ping_latency',
+    'stdev_full_ping_latency',
+})
+
+# Whitelist field names in display order; also the slot layout of PingStats
+_PING_STATS_FIELDS = tuple(sorted(_PING_FIELD_WHITELIST))
+
+# Sentinel marking a PingStats slot whose field was absent from the poll
+# (None is a legitimate reported value and formats as "N/A")
+_ABSENT = object()
+
+
+@dataclass(slots=True, frozen=True)
+class PingStats(Mapping):
+    """
+    Fixed-layout, read-only container for one poll's ping statistics.
+
+    Known whitelist fields live in slots (attribute reads, no per-sample
+    dict); names outside the whitelist land in `extras`. The mapping
+    interface exposes only the fields actually present in the poll, so the
+    display and tests written against the old dict return keep working.
+    """
+
+    ping_drop_rate: object = _ABSENT
+    ping_latency_ms: object = _ABSENT
+    pop_ping_drop_rate: object = _ABSENT
+    pop_ping_latency_ms: object = _ABSENT
+    seconds_to_first_non_empty_slot: object = _ABSENT
+    ping_latency_ms_mean: object = _ABSENT
+    ping_latency_ms_p50: object = _ABSENT
+    ping_latency_ms_p95: object = _ABSENT
+    ping_latency_ms_p99: object = _ABSENT
+    ping_packets_sent: object = _ABSENT
+    ping_packets_received: object = _ABSENT
+    total_ping_drop: object = _ABSENT
+    count_full_ping_drop: object = _ABSENT
+    total_obstructed_ping_drop: object = _ABSENT
+    count_full_obstructed_ping_drop: object = _ABSENT
+    total_unscheduled_ping_drop: object = _ABSENT
+    count_full_unscheduled_ping_drop: object = _ABSENT
+    mean_all_ping_latency: object = _ABSENT
+    deciles_all_ping_latency: object = _ABSENT
+    mean_full_ping_latency: object = _ABSENT
+    deciles_full_ping_latency: object = _ABSENT
+    stdev_full_ping_latency: object = _ABSENT
+    extras: dict = field(default_factory=dict)
+
+    def __getitem__(self, key):
+        if key in _PING_FIELD_WHITELIST:
+            value = getattr(self, key)
+            if value is not _ABSENT:
+                return value
+        elif key in self.extras:
+            return self.extras[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        for name in _PING_STATS_FIELDS:
+            if getattr(self, name) is not _ABSENT:
+                yield name
+        yield from self.extras
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+# Ping-related keys per data source ('status' / 'history'), derived on the
+# first poll and reused while the source's key set is unchanged. The fields
+# reported by starlink_grpc are static per firmware, so after warmup each poll
+# does plain dict lookups instead of substring-matching every key.
+_ping_key_cache = {}
+
+
+def _ping_keys(source, data):
+    """Return the ping-related keys of `data`, cached per source name"""
+    all_keys = frozenset(data.keys())
+    cached = _ping_key_cache.get(source)
+    if cached is None or cached[0] != all_keys:
+        # Known fields resolve through one C-level intersection; only names
+        # outside the whitelist (e.g. from newer firmware) need the scan
+        matched = all_keys & _PING_FIELD_WHITELIST
+        matched |= frozenset(
+            key for key in all_keys - _PING_FIELD_WHITELIST
+            if _PING_RE.search(key) and not _is_obsolete_field_fast(key))
+        cached = (all_keys, matched)
+        _ping_key_cache[source] = cached
+    return cached[1]
+
+
+def _ping_items(source, data):
+    """
+    Yield the ping-related (key, value) pairs of `data`.
+
+    Mappings (the starlink_grpc return type) go through the cached per-source
+    key set; any other iterable of pairs is filtered inline in a single pass
+    without being realized into an intermediate dict first.
+    """
+    if isinstance(data, Mapping):
+        return ((key, data[key]) for key in _ping_keys(source, data))
+    return ((key, value) for key, value in data
+            if key in _PING_FIELD_WHITELIST
+            or (_PING_RE.search(key) and not _is_obsolete_field_fast(key)))
 
 
 def extract_ping_stats(status_data, history_stats=None):
     """
     Extract all ping-related statistics from status and history data.
-    
+
     Args:
-        status_data: Dictionary containing status information from get_status()
-        history_stats: Optional dictionary containing history statistics
-        
+        status_data: Mapping of status information from get_status(), or any
+            iterable of (field_name, value) pairs
+        history_stats: Optional mapping (or iterable of pairs) of history
+            statistics
+
     Returns:
-        Dictionary containing only ping-related fields that are not obsolete
-    """
-    ping_stats = {}
-    
-    # Extract ping fields from status_data
-    if status_data:
-        for key, value in status_data.items():
-            # Check if field name contains 'ping' (case insensitive)
-            if 'ping' in key.lower() and not is_obsolete_field(key):
-                ping_stats[key] = value
-    
-    # Extract ping fields from history_stats
-    if history_stats:
-        for key, value in history_stats.items():
-            # Check if field name contains 'ping' (case insensitive)
-            if 'ping' in key.lower() and not is_obsolete_field(key):
-                ping_stats[key] = value
-    
+        PingStats containing only ping-related fields that are not obsolete
+    """
+    status_view = dict(_ping_items('status', status_data)) if status_data else {}
+    history_view = dict(_ping_items('history', history_stats)) if history_stats else {}
+
+    # Merge the two filtered views in one C-level dict merge
+    merged = status_view | history_view
+
     # Always include seconds_to_first_non_empty_slot if available
-    if status_data and 'seconds_to_first_non_empty_slot' in status_data:
-        ping_stats['seconds_to_first_non_empty_slot'] = status_data['seconds_to_first_non_empty_slot']
-    
-    return ping_stats
+    if isinstance(status_data, Mapping) and 'seconds_to_first_non_empty_slot' in status_data:
+        merged['seconds_to_first_non_empty_slot'] = status_data['seconds_to_first_non_empty_slot']
+
+    extras = {key: merged.pop(key) for key in
+              [key for key in merged if key not in _PING_FIELD_WHITELIST]}
+    return PingStats(extras=extras, **merged)
+
+
+def extract_ping_stats_pb(status_msg, history_msg=None):
+    """
+    Extract ping statistics straight from protobuf messages.
+
+    Skips the message-to-dict conversion entirely: only the fields actually
+    set on each message are walked, via ListFields(), and each name goes
+    through the same whitelist and classification as the mapping path. Note
+    that proto3 scalar fields left at their zero value are not listed, so
+    they are absent from the result rather than reported as zero.
+
+    Args:
+        status_msg: Protobuf status message, or None
+        history_msg: Optional protobuf history message
+
+    Returns:
+        PingStats, as from extract_ping_stats()
+    """
+    status_items = None
+    if status_msg is not None:
+        status_items = ((descriptor.name, value)
+                        for descriptor, value in status_msg.ListFields())
+    history_items = None
+    if history_msg is not None:
+        history_items = ((descriptor.name, value)
+                         for descriptor, value in history_msg.ListFields())
+    return extract_ping_stats(status_items, history_items)
+
+
+# format_value dispatch table, keyed on exact type: one hash lookup instead
+# of an isinstance chain. type(True) is bool, so the bool-before-int ordering
+# concern of isinstance dispatch does not arise.
+_FORMATTERS = {
+    type(None): lambda value: "N/A",
+    bool: lambda value: "Yes" if value else "No",
+    # format() dispatches straight to float.__format__ without the f-string
+    # frame setup
+    float: lambda value: format(value, '.3f'),
+    int: str,
+    str: str,
+}
+
+
+# Formatted strings for the three interpreter singletons, keyed on object
+# identity. Their ids are stable for the life of the process, so one
+# pointer-keyed probe resolves them before any type dispatch.
+_CONST_FMT = {id(None): "N/A", id(True): "Yes", id(False): "No"}
 
 
 def format_value(value):
     """Format a value for display"""
-    if value is None:
-        return "N/A"
-    elif isinstance(value, float):
-        return f"{value:.3f}"
-    elif isinstance(value, bool):
-        return "Yes" if value else "No"
-    else:
-        return str(value)
+    const = _CONST_FMT.get(id(value))
+    if const is not None:
+        return const
+    return _FORMATTERS.get(type(value), str)(value)
 
 
-def display_ping_stats(ping_stats, timestamp, iteration):
+def display_ping_stats(ping_stats, timestamp, iteration, status_errors=None):
     """
     Display ping statistics in a clean, readable format.
-    
+
     Args:
         ping_stats: Dictionary of ping statistics
         timestamp: Timestamp of the data collection
         iteration: Current iteration number
+        status_errors: Optional error report shown inside the frame, so it
+            is overwritten by the next clean frame instead of lingering
+            below it
     """
-    clear_terminal()
-    
-    print("=" * 80)
-    print("STARLINK PING STATISTICS MONITOR")
-    print("=" * 80)
-    print(f"Timestamp: {timestamp}")
-    print(f"Iteration: {iteration}")
-    print(f"Press Ctrl+C to stop")
-    print("=" * 80)
-    print()
-    
-    if not ping_stats:
-        print("No ping statistics available")
-    else:
-        # Sort keys for consistent display
-        sorted_keys = sorted(ping_stats.keys())
-        
-        # Calculate max key length for formatting
-        max_key_len = max(len(key) for key in sorted_keys) if sorted_keys else 0
-        
-        for key in sorted_keys:
-            value = ping_stats[key]
-            formatted_value = format_value(value)
-            print(f"  {key:<{max_key_len}} : {formatted_value}")
-    
-    print()
-    print("=" * 80)
+    extra_lines = (f"Errors: {status_errors}",) if status_errors else ()
+    _display.show(ping_stats, timestamp, iteration,
+                  format_value=format_value, extra_lines=extra_lines)
 
 
 def check_dish_connectivity():
-    """Check if Starlink dish is reachable"""
-    import socket
-    
+    """
+    Check if Starlink dish is reachable.
+
+    Waits for the shared gRPC channel to become ready rather than probing
+    with a throwaway TCP socket, so the connection used for the health check
+    is the same warmed-up channel the monitor polls over.
+    """
+    import grpc
+
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex(('192.168.100.1', 9200))
-        sock.close()
-        
-        if result != 0:
-            print("ERROR: Cannot reach Starlink dish at 192.168.100.1:9200")
-            print("Please ensure:")
-            print("  1. Your Starlink dish is powered on")
-            print("  2. You are connected to the Starlink network")
-            print("  3. You can access http://192.168.100.1 in a browser")
-            return False
+        channel = get_channel_context().get_channel()
+        grpc.channel_ready_future(channel).result(timeout=2)
         return True
+    except grpc.FutureTimeoutError:
+        print("ERROR: Cannot reach Starlink dish at 192.168.100.1:9200")
+        print("Please ensure:")
+        print("  1. Your Starlink dish is powered on")
+        print("  2. You are connected to the Starlink network")
+        print("  3. You can access http://192.168.100.1 in a browser")
+        return False
     except Exception as e:
         print(f"ERROR: Could not check dish connectivity: {e}")
         return False
 
 
+# A short TTL keeps rapid consumers within one tick from issuing duplicate
+# RPCs at the dish, while every 1 s poll still fetches fresh data
+@ttl_cached(0.25)
+def _get_status():
+    return starlink_grpc.get_status(context=get_channel_context())
+
+
+@ttl_cached(0.25)
+def _history_ping_stats():
+    return starlink_grpc.history_ping_stats(context=get_channel_context())
+
+
+async def collect_sample():
+    """
+    Fetch status and history ping stats concurrently.
+
+    Both starlink_grpc calls are blocking gRPC round-trips; running them in
+    worker threads overlaps the two round-trips instead of paying them
+    back-to-back.
+
+    Returns:
+        Tuple of (status_data, status_errors, history_stats). history_stats
+        is None when history is not available.
+    """
+    status_result, history_result = await asyncio.gather(
+        asyncio.to_thread(_get_status),
+        asyncio.to_thread(_history_ping_stats),
+        return_exceptions=True)
+
+    if isinstance(status_result, BaseException):
+        raise status_result
+    status_data, status_errors = status_result
+
+    # History stats might not be available, continue without them
+    history_stats = None
+    if not isinstance(history_result, BaseException):
+        history_stats = history_result
+
+    return status_data, status_errors, history_stats
+
+
+async def monitor_loop(poll_interval=1.0):
+    """Poll the dish once per interval and refresh the display"""
+
+    iteration = 0
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+
+    try:
+        while True:
+            iteration += 1
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            try:
+                # Get status and history data from dish (concurrently)
+                status_data, status_errors, history_stats = await collect_sample()
+
+                # Extract ping-related statistics
+                ping_stats = extract_ping_stats(status_data, history_stats)
+
+                # Display the statistics (and any errors, inside the frame)
+                display_ping_stats(ping_stats, timestamp, iteration,
+                                   status_errors=status_errors)
+
+            except Exception as e:
+                _display.write_frame([
+                    "=" * 80,
+                    "STARLINK PING STATISTICS MONITOR",
+                    "=" * 80,
+                    f"Timestamp: {timestamp}",
+                    f"Iteration: {iteration}",
+                    "=" * 80,
+                    "",
+                    f"Error collecting data: {e}",
+                    "",
+                    "=" * 80,
+                ])
+
+            # Sleep towards a monotonic deadline so the poll cadence does not
+            # drift by however long the RPCs took
+            deadline += poll_interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+    except asyncio.CancelledError:
+        # Raised when Ctrl+C cancels the task under asyncio.run().
+        # The summary goes out as one write rather than a print per line.
+        _display.restore()
+        sys.stdout.write('\n'.join([
+            "",
+            "=" * 80,
+            "STARLINK PING STATISTICS MONITOR - STOPPED",
+            "=" * 80,
+            f"Total iterations: {iteration}",
+            "Monitor stopped by user",
+            "=" * 80,
+            "",
+        ]))
+        sys.stdout.flush()
+        raise
+
+
 def main():
     """Main function to run the ping statistics monitor"""
-    
+
     print("Starlink Ping Statistics Monitor")
     print("=" * 80)
     print()
     print("Checking Starlink dish connectivity at 192.168.100.1...")
-    
+
     if not check_dish_connectivity():
         sys.exit(1)
-    
+
     print("✓ Dish is reachable")
     print()
     print("Starting monitor... (Press Ctrl+C to stop)")
     time.sleep(2)
-    
-    iteration = 0
-    
+
     try:
-        while True:
-            iteration += 1
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            try:
-                # Get status data from dish
-                status_data, status_errors = starlink_grpc.get_status()
-                
-                # Try to get history ping stats
-                history_stats = None
-                try:
-                    history_stats = starlink_grpc.history_ping_stats()
-                except Exception as e:
-                    # History stats might not be available, continue without them
-                    pass
-                
-                # Extract ping-related statistics
-                ping_stats = extract_ping_stats(status_data, history_stats)
-                
-                # Display the statistics
-                display_ping_stats(ping_stats, timestamp, iteration)
-                
-                # Display any errors
-                if status_errors:
-                    print(f"Errors: {status_errors}")
-                
-            except Exception as e:
-                clear_terminal()
-                print("=" * 80)
-                print("STARLINK PING STATISTICS MONITOR")
-                print("=" * 80)
-                print(f"Timestamp: {timestamp}")
-                print(f"Iteration: {iteration}")
-                print("=" * 80)
-                print()
-                print(f"Error collecting data: {e}")
-                print()
-                print("=" * 80)
-            
-            # Wait 1 second before next poll
-            time.sleep(1)
-    
+        asyncio.run(monitor_loop())
     except KeyboardInterrupt:
-        clear_terminal()
-        print("\n" + "=" * 80)
-        print("STARLINK PING STATISTICS MONITOR - STOPPED")
-        print("=" * 80)
-        print(f"Total iterations: {iteration}")
-        print("Monitor stopped by user")
-        print("=" * 80)
         sys.exit(0)
 
 
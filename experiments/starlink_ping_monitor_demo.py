@@ -9,14 +9,20 @@ This script does NOT require a Starlink dish and can be run anywhere.
 """
 
 import time
-import os
 import random
 from datetime import datetime
 
+from starlink_ping_common import PingDisplay
 
-def clear_terminal():
-    """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+# Shared frame renderer; caches the display layout between ticks
+_display = PingDisplay(
+    title="STARLINK PING STATISTICS MONITOR (DEMO)",
+    footer_lines=(
+        "",
+        "NOTE: This is a DEMO with simulated data.",
+        "The actual starlink_ping_monitor.py script polls real Starlink dish data.",
+        "",
+    ))
 
 
 def generate_sample_ping_stats(iteration):
@@ -38,33 +44,7 @@ def generate_sample_ping_stats(iteration):
 
 def display_ping_stats(ping_stats, timestamp, iteration):
     """Display ping statistics in a clean, readable format"""
-    clear_terminal()
-    
-    print("=" * 80)
-    print("STARLINK PING STATISTICS MONITOR (DEMO)")
-    print("=" * 80)
-    print(f"Timestamp: {timestamp}")
-    print(f"Iteration: {iteration}")
-    print(f"Press Ctrl+C to stop")
-    print("=" * 80)
-    print()
-    
-    # Sort keys for consistent display
-    sorted_keys = sorted(ping_stats.keys())
-    
-    # Calculate max key length for formatting
-    max_key_len = max(len(key) for key in sorted_keys) if sorted_keys else 0
-    
-    for key in sorted_keys:
-        value = ping_stats[key]
-        print(f"  {key:<{max_key_len}} : {value}")
-    
-    print()
-    print("=" * 80)
-    print()
-    print("NOTE: This is a DEMO with simulated data.")
-    print("The actual starlink_ping_monitor.py script polls real Starlink dish data.")
-    print()
+    _display.show(ping_stats, timestamp, iteration)
 
 
 def main():
@@ -95,7 +75,7 @@ def main():
             time.sleep(1)
     
     except KeyboardInterrupt:
-        clear_terminal()
+        _display.restore()
         print("\n" + "=" * 80)
         print("STARLINK PING STATISTICS MONITOR - DEMO STOPPED")
         print("=" * 80)